@@ -21,7 +21,7 @@ import platform
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
-from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
 from pathlib import Path
 from typing import Any, NamedTuple, Union
@@ -29,6 +29,7 @@ from typing import Any, NamedTuple, Union
 import fsspec
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 from fsspec.implementations.local import make_path_posix
@@ -81,6 +82,9 @@ class FeatherFile(NamedTuple):
 
 _NAUTILUS_PATH = "NAUTILUS_PATH"
 _DEFAULT_FS_PROTOCOL = "file"
+_ARROW_BATCH_ROWS = 8192  # Max rows per record batch when scanning (sized to stay cache resident)
+_PARQUET_COMPRESSION = "zstd"
+_PARQUET_COMPRESSION_LEVEL = 3
 
 
 class ParquetDataCatalog(BaseDataCatalog):
@@ -214,14 +218,13 @@ class ParquetDataCatalog(BaseDataCatalog):
     def _objects_to_table(self, data: list[Data], data_cls: type) -> pa.Table:
         PyCondition.not_empty(data, "data")
         PyCondition.list_type(data, data_cls, "data")
-        sorted_data = sorted(data, key=lambda x: x.ts_init)
 
-        # Check data is strictly non-decreasing prior to write
-        for original, sorted_version in zip(data, sorted_data, strict=False):
-            if original.ts_init != sorted_version.ts_init:
+        # Check data is strictly non-decreasing prior to write (single pass, no sorted copy)
+        for previous, current in itertools.pairwise(data):
+            if previous.ts_init > current.ts_init:
                 raise ValueError(
                     "Data should be monotonically increasing (or non-decreasing) based on `ts_init`: "
-                    f"found {original.ts_init} followed by {sorted_version.ts_init}. "
+                    f"found {previous.ts_init} followed by {current.ts_init}. "
                     "Consider sorting your data with something like "
                     "`data.sort(key=lambda x: x.ts_init)` prior to writing to the catalog",
                 )
@@ -232,7 +235,10 @@ class ParquetDataCatalog(BaseDataCatalog):
         if isinstance(table_or_batch, pa.RecordBatch):
             return pa.Table.from_batches([table_or_batch])
         else:
-            return table_or_batch
+            # Consolidate into contiguous column buffers once (per-object encoders produce
+            # a chunk per row), so any schema cast and the parquet encoding each make a
+            # single pass over each column rather than over many tiny chunks.
+            return table_or_batch.combine_chunks()
 
     def _make_path(self, data_cls: type[Data], instrument_id: str | None = None) -> str:
         if instrument_id is not None:
@@ -266,6 +272,12 @@ class ParquetDataCatalog(BaseDataCatalog):
                 mode=mode,
             )
         else:
+            if "file_options" not in kw:
+                kw["file_options"] = pds.ParquetFileFormat().make_write_options(
+                    compression=_PARQUET_COMPRESSION,
+                    compression_level=_PARQUET_COMPRESSION_LEVEL,
+                )
+
             # Write parquet file
             pds.write_dataset(
                 data=table,
@@ -290,31 +302,47 @@ class ParquetDataCatalog(BaseDataCatalog):
         fs.mkdirs(path, exist_ok=True)
         parquet_file = f"{path}/{name}.parquet"
 
-        # following solution from https://stackoverflow.com/a/70817689
-        if mode != "overwrite" and Path(parquet_file).exists():
-            existing_table = pq.read_table(source=parquet_file, pre_buffer=False, memory_map=True)
-
+        if mode not in ("append", "prepend") or not fs.exists(parquet_file):
             with pq.ParquetWriter(
                 where=parquet_file,
-                schema=existing_table.schema,
+                schema=table.schema,
                 filesystem=fs,
-                write_batch_size=self.max_rows_per_group,
-            ) as pq_writer:
-                table = table.cast(existing_table.schema)
-
-                if mode == "append":
-                    pq_writer.write_table(existing_table)
-                    pq_writer.write_table(table)
-                elif mode == "prepend":
-                    pq_writer.write_table(table)
-                    pq_writer.write_table(existing_table)
-        else:
-            pq.write_table(
-                table,
-                where=parquet_file,
-                filesystem=fs,
-                row_group_size=self.max_rows_per_group,
-            )
+                compression=_PARQUET_COMPRESSION,
+                compression_level=_PARQUET_COMPRESSION_LEVEL,
+            ) as writer:
+                writer.write_table(table, row_group_size=self.max_rows_per_group)
+            return
+
+        # Stream the existing file through in row group sized batches (bounding memory to a
+        # batch rather than the whole file), writing to a temporary file which then replaces
+        # the original. A single writer keeps row groups sized consistently.
+        # Hidden name so dataset discovery (and `backend_session`) ignores the file while in progress
+        tmp_file = f"{path}/.{name}.parquet.tmp"
+        try:
+            with pq.ParquetFile(parquet_file, filesystem=fs) as existing_file:
+                table = table.cast(existing_file.schema_arrow)
+
+                with pq.ParquetWriter(
+                    where=tmp_file,
+                    schema=table.schema,
+                    filesystem=fs,
+                    compression=_PARQUET_COMPRESSION,
+                    compression_level=_PARQUET_COMPRESSION_LEVEL,
+                ) as writer:
+                    if mode == "prepend":
+                        writer.write_table(table, row_group_size=self.max_rows_per_group)
+
+                    for batch in existing_file.iter_batches(batch_size=self.max_rows_per_group):
+                        writer.write_batch(batch, row_group_size=self.max_rows_per_group)
+
+                    if mode == "append":
+                        writer.write_table(table, row_group_size=self.max_rows_per_group)
+        except Exception:
+            if fs.exists(tmp_file):
+                fs.rm(tmp_file)
+            raise
+
+        fs.mv(tmp_file, parquet_file)
 
     def write_data(
         self,
@@ -326,7 +354,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         """
         Write the given `data` to the catalog.
 
-        The function categorizes the data based on their class name and, when applicable, their
+        The function categorizes the data based on their class and, when applicable, their
         associated instrument ID. It then delegates the actual writing process to the
         `write_chunk` method.
 
@@ -359,45 +387,77 @@ class ParquetDataCatalog(BaseDataCatalog):
         Notes
         -----
          - All data of the same type is expected to be monotonically increasing, or non-decreasing.
-         - The data is sorted and grouped based on its class name and instrument ID (if applicable) before writing.
+         - The data is grouped based on its class and instrument ID (if applicable) before writing, preserving order.
          - Instrument-specific data should have either an `instrument_id` attribute or be an instance of `Instrument`.
          - The `Bar` class is treated as a special case, being grouped based on its `bar_type` attribute.
          - The input data list must be non-empty, and all data items must be of the appropriate class type.
+         - Groups written to different files are written concurrently on a thread pool.
+         - Writes are not atomic across groups, if one group fails then all other groups are still
+           written (or overwritten) before the first error is raised.
 
         Raises
         ------
         ValueError
             If data of the same type is not monotonically increasing (or non-decreasing) based on `ts_init`.
+            Other groups in `data` will still have been written.
 
         """
 
-        def key(obj: Any) -> tuple[str, str | None]:
-            name = type(obj).__name__
+        def key(obj: Any) -> tuple[type, str | None]:
             if isinstance(obj, CustomData):
                 obj = obj.data
-                name = type(obj).__name__
+            cls = type(obj)
             if isinstance(obj, Instrument):
-                return name, obj.id.value
+                return cls, obj.id.value
             elif hasattr(obj, "bar_type"):
-                return name, str(obj.bar_type)
+                return cls, str(obj.bar_type)
             elif hasattr(obj, "instrument_id"):
-                return name, obj.instrument_id.value
-            return name, None
-
-        def obj_to_type(obj: Data) -> type:
-            return type(obj) if not isinstance(obj, CustomData) else obj.data.__class__
-
-        name_to_cls = {cls.__name__: cls for cls in {obj_to_type(d) for d in data}}
-        for (cls_name, instrument_id), single_type in groupby(sorted(data, key=key), key=key):
-            chunk = list(single_type)
-            self.write_chunk(
-                data=chunk,
-                data_cls=name_to_cls[cls_name],
-                instrument_id=instrument_id,
-                basename_template=basename_template,
-                mode=mode,
-                **kwargs,
-            )
+                return cls, obj.instrument_id.value
+            return cls, None
+
+        # Single pass grouping (computes each key once and preserves the input order within
+        # each group, which the monotonic `ts_init` check relies on)
+        groups: defaultdict[tuple[type, str | None], list] = defaultdict(list)
+        for obj in data:
+            groups[key(obj)].append(obj)
+
+        self._write_groups(groups, basename_template=basename_template, mode=mode, **kwargs)
+
+    def _write_groups(
+        self,
+        groups: dict[tuple[type, str | None], list],
+        basename_template: str,
+        mode: str,
+        **kwargs: Any,
+    ) -> None:
+        # Chunks sharing an output path are written in order by a single task, while
+        # distinct paths are written concurrently (Arrow releases the GIL while
+        # encoding and compressing parquet).
+        path_chunks: dict[str, list[tuple[type, str | None, list]]] = defaultdict(list)
+        for (data_cls, instrument_id), chunk in groups.items():
+            path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
+            path_chunks[path].append((data_cls, instrument_id, chunk))
+
+        def write_chunks(chunks: list[tuple[type, str | None, list]]) -> None:
+            for data_cls, instrument_id, chunk in chunks:
+                self.write_chunk(
+                    data=chunk,
+                    data_cls=data_cls,
+                    instrument_id=instrument_id,
+                    basename_template=basename_template,
+                    mode=mode,
+                    **kwargs,
+                )
+
+        if len(path_chunks) <= 1:
+            for chunks in path_chunks.values():
+                write_chunks(chunks)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(path_chunks), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(write_chunks, chunks) for chunks in path_chunks.values()]
+            for future in futures:
+                future.result()  # Propagate any write errors
 
     # -- QUERIES ----------------------------------------------------------------------------------
 
@@ -466,17 +526,20 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         file_prefix = class_to_filename(data_cls)
         glob_path = f"{self.path}/data/{file_prefix}/**/*"
-        paths: list[str] = self.fs.glob(glob_path)
-
-        # Ensure all paths are files (fsspec now includes directories in recursive globbing)
-        paths = [path for path in paths if self.fs.isfile(path)]
+        # Ensure all paths are files (fsspec now includes directories in recursive globbing),
+        # using the listing details rather than issuing a further stat call per path.
+        # Hidden and underscore prefixed files are skipped, matching pyarrow dataset discovery.
+        paths: list[str] = [
+            path
+            for path, info in self.fs.glob(glob_path, detail=True).items()
+            if info["type"] == "file" and not path.rsplit("/", 1)[-1].startswith((".", "_"))
+        ]
 
         if self.show_query_paths:
             for dir in paths:
                 print(dir)
 
         for idx, path in enumerate(paths):
-            assert self.fs.exists(path)
             # Parse the parent directory which *should* be the instrument ID,
             # this prevents us matching all instrument ID substrings.
             dir = path.split("/")[-2]
@@ -613,28 +676,39 @@ class ParquetDataCatalog(BaseDataCatalog):
         # Original dataset
         dataset = pds.dataset(path, filesystem=self.fs)
 
-        # Instrument id filters (not stored in table, need to filter based on files)
-        if instrument_ids is not None:
-            if not isinstance(instrument_ids, list):
-                instrument_ids = [instrument_ids]
-
-            valid_files = [
-                fn
-                for fn in dataset.files
-                if any(urisafe_instrument_id(x) in fn for x in instrument_ids)
-            ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
-
-        if bar_types is not None:
-            if not isinstance(bar_types, list):
-                bar_types = [bar_types]
+        if instrument_ids is None and bar_types is None:
+            return dataset
+
+        # Instrument id and bar type filters (not stored in table, need to filter based on files)
+        if instrument_ids is not None and not isinstance(instrument_ids, list):
+            instrument_ids = [instrument_ids]
+        if bar_types is not None and not isinstance(bar_types, list):
+            bar_types = [bar_types]
+
+        # Filter the already discovered fragments, rather than building (and discovering)
+        # a new dataset from the filtered file paths for each filter
+        fragments = [
+            fragment
+            for fragment in dataset.get_fragments()
+            if (
+                instrument_ids is None
+                or any(urisafe_instrument_id(x) in fragment.path for x in instrument_ids)
+            )
+            and (
+                bar_types is None
+                or any(str(x).replace("/", "") in fragment.path for x in bar_types)
+            )
+        ]
 
-            valid_files = [
-                fn for fn in dataset.files if any(str(x).replace("/", "") in fn for x in bar_types)
-            ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+        # Take the schema (and its metadata) from the first matching file
+        schema = fragments[0].physical_schema if fragments else dataset.schema
 
-        return dataset
+        return pds.FileSystemDataset(
+            fragments,
+            schema=schema,
+            format=dataset.format,
+            filesystem=dataset.filesystem,
+        )
 
     def _filter_dataset(
         self,
@@ -658,7 +732,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         else:
             filter_ = None
 
-        return dataset.to_table(filter=filter_)
+        return dataset.to_table(filter=filter_, batch_size=_ARROW_BATCH_ROWS)
 
     def query_last_timestamp(
         self,
@@ -711,9 +785,13 @@ class ParquetDataCatalog(BaseDataCatalog):
         if dataset is None:
             return None
 
-        return time_object_to_dt(
-            dataset.sort_by([(ts_column, "descending")]).head(1)[ts_column].to_pylist()[0],
-        )
+        # Scan only the timestamp column and reduce it in a single vectorized pass,
+        # rather than sorting every column of the dataset to take the first row.
+        last_timestamp = pc.max(dataset.to_table(columns=[ts_column]).column(ts_column)).as_py()
+        if last_timestamp is None:
+            return None
+
+        return time_object_to_dt(last_timestamp)
 
     def _build_query(
         self,
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from functools import cache
+
 from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.core.nautilus_pyo3 import convert_to_snake_case
 from nautilus_trader.model.identifiers import InstrumentId
@@ -24,7 +26,15 @@ CUSTOM_DATA_PREFIX = "custom_"
 def class_to_filename(cls: type) -> str:
     """
     Convert the given class to a filename.
+
+    The result is cached per class, as this is called for every object written.
+
     """
+    return _class_to_filename(cls)
+
+
+@cache
+def _class_to_filename(cls: type) -> str:
     filename_mappings = {"OrderBookDeltas": "OrderBookDelta"}
     name = f"{convert_to_snake_case(filename_mappings.get(cls.__name__, cls.__name__))}"
     if not is_nautilus_class(cls):
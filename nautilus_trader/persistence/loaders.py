@@ -16,7 +16,9 @@
 from os import PathLike
 from typing import Any
 
+import fsspec
 import pandas as pd
+import pyarrow.parquet as pq
 
 
 class CSVTickDataLoader:
@@ -129,7 +131,7 @@ class ParquetTickDataLoader:
         pd.DataFrame
 
         """
-        df = pd.read_parquet(file_path)
+        df = _read_parquet(file_path)
         df = df.set_index(timestamp_column)
         return df
 
@@ -154,6 +156,19 @@ class ParquetBarDataLoader:
         pd.DataFrame
 
         """
-        df = pd.read_parquet(file_path)
+        df = _read_parquet(file_path)
         df = df.set_index("timestamp")
         return df
+
+
+def _read_parquet(file_path: PathLike[str] | str) -> pd.DataFrame:
+    # Resolve URLs (e.g. 'https://', 's3://') through `fsspec`, as `pd.read_parquet` does
+    if isinstance(file_path, str) and "://" in file_path:
+        with fsspec.open(file_path, "rb") as f:
+            table = pq.read_table(f)
+    else:
+        table = pq.read_table(file_path)
+
+    # Give each column its own block (avoids consolidation copies) and release
+    # the Arrow buffers as each column is converted, to bound peak memory.
+    return table.to_pandas(split_blocks=True, self_destruct=True)
@@ -152,11 +152,10 @@ class OrderBookDeltaDataWranglerV2(WranglerBase):
         else:
             df["ts_init"] = df["ts_event"] + ts_init_delta
 
-        # Reorder the columns and drop index column
+        # Reorder the columns (index is dropped during Arrow conversion)
         df = df[["price", "size", "aggressor_side", "trade_id", "ts_event", "ts_init"]]
-        df = df.reset_index(drop=True)
 
-        table = pa.Table.from_pandas(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
 
         return self.from_arrow(table)
 
@@ -269,11 +268,10 @@ class QuoteTickDataWranglerV2(WranglerBase):
         else:
             df["ts_init"] = df["ts_event"] + ts_init_delta
 
-        # Reorder the columns and drop index column
+        # Reorder the columns (index is dropped during Arrow conversion)
         df = df[["bid_price", "ask_price", "bid_size", "ask_size", "ts_event", "ts_init"]]
-        df = df.reset_index(drop=True)
 
-        table = pa.Table.from_pandas(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
 
         return self.from_arrow(table)
 
@@ -382,11 +380,10 @@ class TradeTickDataWranglerV2(WranglerBase):
         else:
             df["ts_init"] = df["ts_event"] + ts_init_delta
 
-        # Reorder the columns and drop index column
+        # Reorder the columns (index is dropped during Arrow conversion)
         df = df[["price", "size", "aggressor_side", "trade_id", "ts_event", "ts_init"]]
-        df = df.reset_index(drop=True)
 
-        table = pa.Table.from_pandas(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
 
         return self.from_arrow(table)
 
@@ -498,10 +495,9 @@ class BarDataWranglerV2(WranglerBase):
         else:
             df["ts_init"] = df["ts_event"] + ts_init_delta
 
-        # Reorder the columns and drop index column
+        # Reorder the columns (index is dropped during Arrow conversion)
         df = df[["open", "high", "low", "close", "volume", "ts_event", "ts_init"]]
-        df = df.reset_index(drop=True)
 
-        table = pa.Table.from_pandas(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
 
         return self.from_arrow(table)
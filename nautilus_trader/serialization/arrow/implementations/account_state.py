@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections import defaultdict
 from typing import Any
 
 import msgspec
@@ -128,12 +129,12 @@ def _deserialize(values: list[Any]) -> AccountState:
 
 
 def deserialize(data: pa.RecordBatch) -> list[AccountState]:
-    account_states = []
-    for event_id in data.column("event_id").unique().to_pylist():
-        event = data.filter(pa.compute.equal(data["event_id"], event_id))
-        account = _deserialize(values=event.to_pylist())
-        account_states.append(account)
-    return account_states
+    # Group rows by event ID in a single hashed pass (preserving first seen order),
+    # rather than filtering the whole batch once per unique event ID
+    events: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in data.to_pylist():
+        events[row["event_id"]].append(row)
+    return [_deserialize(values=values) for values in events.values()]
 
 
 SCHEMA = pa.schema(
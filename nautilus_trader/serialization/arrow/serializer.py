@@ -14,10 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 from collections.abc import Callable
-from io import BytesIO
 from typing import Any, Union
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from nautilus_trader.common.messages import ComponentStateChanged
 from nautilus_trader.common.messages import ShutdownSystem
@@ -61,6 +61,7 @@ NautilusRustDataType = Union[  # noqa: UP007 (mypy does not like pipe operators)
 
 _ARROW_ENCODERS: dict[type, Callable] = {}
 _ARROW_DECODERS: dict[type, Callable] = {}
+_ARROW_BATCH_ENCODERS: dict[type, Callable] = {}
 _SCHEMAS: dict[type, pa.Schema] = {}
 
 
@@ -77,6 +78,7 @@ def register_arrow(
     schema: pa.Schema | None,
     encoder: Callable | None = None,
     decoder: Callable | None = None,
+    batch_encoder: Callable | None = None,
 ) -> None:
     """
     Register a new class for serialization to parquet.
@@ -92,6 +94,9 @@ def register_arrow(
         The callable to encode instances of type `cls_type` to Arrow record batches.
     decoder : Callable, optional
         The callable to decode rows from Arrow record batches into `cls_type`.
+    batch_encoder : Callable, optional
+        The callable to encode a list of `cls_type` instances to a single Arrow record batch.
+        If not specified, batches are encoded one object at a time with `encoder`.
     table : type, optional
         An optional table override for `cls`. Used if `cls` is going to be
         transformed and stored in a table other than its own.
@@ -100,9 +105,14 @@ def register_arrow(
     PyCondition.type(schema, pa.Schema, "schema")
     PyCondition.type_or_none(encoder, Callable, "encoder")
     PyCondition.type_or_none(decoder, Callable, "decoder")
+    PyCondition.type_or_none(batch_encoder, Callable, "batch_encoder")
 
     if encoder is not None:
         _ARROW_ENCODERS[data_cls] = encoder
+        # A batch encoder is only valid alongside the encoder it was registered with
+        _ARROW_BATCH_ENCODERS.pop(data_cls, None)
+    if batch_encoder is not None:
+        _ARROW_BATCH_ENCODERS[data_cls] = batch_encoder
     if decoder is not None:
         _ARROW_DECODERS[data_cls] = decoder
     if schema is not None:
@@ -125,7 +135,10 @@ class ArrowSerializer:
         data: list[Data],
         data_cls: type,
     ) -> pa.Table | pa.RecordBatch:
-        data = sorted(data, key=lambda x: x.ts_init)
+        if data_cls == OrderBookDeltas:
+            # Order the containers before unpacking (rather than the unpacked deltas) so each
+            # container's deltas stay contiguous, preserving the `F_LAST` batch boundaries
+            data = sorted(data, key=lambda x: x.ts_init)
         data = ArrowSerializer._unpack_container_objects(data_cls, data)
 
         match data_cls:
@@ -172,8 +185,20 @@ class ArrowSerializer:
                         f"Unsupported Rust defined data type for catalog write, was `{data_cls}`",
                     )
 
-        reader = pa.ipc.open_stream(BytesIO(batch_bytes))
+        # Read directly from the bytes buffer (zero-copy), a file-like wrapper
+        # would copy every message through Python reads.
+        reader = pa.ipc.open_stream(pa.py_buffer(batch_bytes))
         table: pa.Table = reader.read_all()
+
+        if data_cls == OrderBookDeltas:
+            return table  # Already ordered by container above
+
+        # Sort by `ts_init` in Arrow (stable) and only when required, input is
+        # usually already in order so a single vectorized check avoids the sort
+        ts_init = table.column("ts_init")
+        if len(ts_init) > 1 and not pc.all(pc.greater_equal(ts_init[1:], ts_init[:-1])).as_py():
+            table = table.sort_by("ts_init")
+
         return table
 
     @staticmethod
@@ -227,6 +252,14 @@ class ArrowSerializer:
         """
         if data_cls in RUST_SERIALIZERS or data_cls.__name__ in RUST_STR_SERIALIZERS:
             return ArrowSerializer.rust_defined_to_record_batch(data, data_cls=data_cls)
+
+        batch_encoder = _ARROW_BATCH_ENCODERS.get(data_cls)
+        if batch_encoder is not None:
+            data = [obj.data if isinstance(obj, CustomData) else obj for obj in data]
+            batch = batch_encoder(data)
+            assert isinstance(batch, pa.RecordBatch)
+            return pa.Table.from_batches([batch])
+
         batches = [ArrowSerializer.serialize(obj, data_cls) for obj in data]
         return pa.Table.from_batches(batches, schema=batches[0].schema)
 
@@ -326,11 +359,13 @@ for _data_cls in NAUTILUS_ARROW_SCHEMA:
             schema=NAUTILUS_ARROW_SCHEMA[_data_cls],
         )
     else:
+        _dict_serializer = make_dict_serializer(NAUTILUS_ARROW_SCHEMA[_data_cls])
         register_arrow(
             data_cls=_data_cls,
             schema=NAUTILUS_ARROW_SCHEMA[_data_cls],
-            encoder=make_dict_serializer(NAUTILUS_ARROW_SCHEMA[_data_cls]),
+            encoder=_dict_serializer,
             decoder=make_dict_deserializer(_data_cls),
+            batch_encoder=_dict_serializer,
         )
 
 
@@ -19,6 +19,7 @@ from decimal import Decimal
 
 import pandas as pd
 import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pytest
 
 from nautilus_trader import TEST_DATA_DIR
@@ -28,6 +29,7 @@ from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.core.rust.model import AggressorSide
 from nautilus_trader.core.rust.model import BookAction
 from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import CustomData
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
@@ -300,6 +302,129 @@ def test_catalog_append_data(catalog: ParquetDataCatalog) -> None:
     assert len(bars) == len(all_bars) == 20
 
 
+def test_catalog_append_data_leaves_no_temporary_file(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    catalog.write_data(stub_bars)
+
+    # Act
+    catalog.write_data(stub_bars, mode="append")
+
+    # Assert
+    assert len(catalog.bars()) == 20
+    assert len(catalog.query_pyarrow(Bar)) == 20
+    files = catalog.fs.find(f"{catalog.path}/data")
+    assert [file.rsplit("/", 1)[-1] for file in files] == ["part-0.parquet"]
+
+
+def test_catalog_prepend_data_memory_row_groups(catalog_memory: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog_memory.max_rows_per_group = 4
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    catalog_memory.write_data(stub_bars)
+
+    # Act
+    catalog_memory.write_data(stub_bars, mode="prepend")
+
+    # Assert
+    path = catalog_memory._make_path(data_cls=type(stub_bars[0]), instrument_id=str(bar_type))
+    with catalog_memory.fs.open(f"{path}/part-0.parquet", "rb") as f:
+        metadata = pq.ParquetFile(f).metadata
+    assert metadata.num_rows == 20
+    assert metadata.num_row_groups == 6  # (4 + 4 + 2) per written table
+
+
+def test_catalog_write_data_zstd_compressed(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+
+    # Act
+    catalog.write_data(stub_bars)
+
+    # Assert
+    path = catalog._make_path(data_cls=type(stub_bars[0]), instrument_id=str(bar_type))
+    metadata = pq.ParquetFile(f"{path}/part-0.parquet", filesystem=catalog.fs).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_catalog_write_data_not_monotonic_raises(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="monotonically increasing"):
+        catalog.write_data(list(reversed(stub_bars)))
+
+
+def test_catalog_write_data_multiple_groups(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    trades = [
+        TestDataStubs.trade_tick(instrument=instrument, trade_id=str(i), ts_event=i, ts_init=i)
+        for i in range(10)
+        for instrument in (audusd, usdjpy)
+    ]
+
+    # Act
+    catalog.write_data([audusd, *trades])
+
+    # Assert
+    assert len(catalog.instruments()) == 1
+    assert len(catalog.trade_ticks(instrument_ids=[audusd.id.value])) == 10
+    assert len(catalog.trade_ticks(instrument_ids=[usdjpy.id.value])) == 10
+
+
+def test_catalog_write_data_multiple_groups_not_monotonic_raises(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    audusd_trades = [
+        TestDataStubs.trade_tick(instrument=audusd, trade_id=str(i), ts_event=i, ts_init=i)
+        for i in range(10)
+    ]
+    usdjpy_trades = [
+        TestDataStubs.trade_tick(instrument=usdjpy, trade_id=str(i), ts_event=i, ts_init=i)
+        for i in reversed(range(10))
+    ]
+
+    # Act
+    with pytest.raises(ValueError, match="monotonically increasing"):
+        catalog.write_data([audusd, *audusd_trades, *usdjpy_trades])
+
+    # Assert (valid groups are still written)
+    assert len(catalog.instruments()) == 1
+    assert len(catalog.trade_ticks(instrument_ids=[audusd.id.value])) == 10
+    files = catalog.fs.find(f"{catalog.path}/data/trade_tick")
+    assert [file.split("/")[-2] for file in files] == ["AUDUSD.SIM"]
+
+
 def test_catalog_bars_querying_by_instrument_id(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
@@ -318,6 +443,59 @@ def test_catalog_bars_querying_by_instrument_id(catalog: ParquetDataCatalog) ->
     assert len(bars) == len(stub_bars) == 10
 
 
+def test_catalog_query_last_timestamp_bars(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    catalog.write_data(stub_bars)
+
+    # Act
+    last_timestamp = catalog.query_last_timestamp(Bar, bar_type=str(bar_type))
+
+    # Assert
+    assert last_timestamp == pd.Timestamp(stub_bars[-1].ts_init, tz="UTC")
+
+
+def test_catalog_query_last_timestamp_instrument_id(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    trades = [
+        TestDataStubs.trade_tick(instrument=audusd, trade_id=str(i), ts_event=i, ts_init=i)
+        for i in range(10)
+    ]
+    catalog.write_data(trades)
+
+    # Act
+    last_timestamp = catalog.query_last_timestamp(TradeTick, instrument_id=audusd.id.value)
+
+    # Assert
+    assert last_timestamp == pd.Timestamp(9, tz="UTC")
+
+
+def test_catalog_query_last_timestamp_no_matching_files_returns_none(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    trades = [
+        TestDataStubs.trade_tick(instrument=audusd, trade_id=str(i), ts_event=i, ts_init=i)
+        for i in range(10)
+    ]
+    catalog.write_data(trades)
+
+    # Act
+    last_timestamp = catalog.query_last_timestamp(TradeTick, instrument_id=usdjpy.id.value)
+
+    # Assert
+    assert last_timestamp is None
+
+
 def test_catalog_write_pyo3_order_book_depth10(catalog: ParquetDataCatalog) -> None:
     # Arrange
     instrument = TestInstrumentProvider.ethusdt_binance()
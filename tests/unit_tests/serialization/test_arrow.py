@@ -29,12 +29,14 @@ from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import ContingencyType
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.enums import TriggerType
 from nautilus_trader.model.events import AccountState
@@ -172,6 +174,40 @@ class TestArrowSerializer:
     def test_serialize_and_deserialize_tick(self, data):
         self._test_serialization(obj=data)
 
+    def test_serialize_batch_quote_ticks_sorts_by_ts_init(self):
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=ts, ts_init=ts) for ts in (3, 1, 2, 2)]
+
+        # Act
+        table = self.serializer.serialize_batch(quotes, data_cls=QuoteTick)
+
+        # Assert
+        assert table.column("ts_init").to_pylist() == [1, 2, 2, 3]
+
+    def test_serialize_batch_order_book_deltas_keeps_containers_contiguous(self):
+        # Arrange
+        def deltas(ts_first: int, ts_last: int) -> OrderBookDeltas:
+            return TestDataStubs.order_book_deltas(
+                deltas=[
+                    TestDataStubs.order_book_delta(ts_event=ts_first, ts_init=ts_first),
+                    TestDataStubs.order_book_delta(
+                        flags=RecordFlag.F_LAST,
+                        ts_event=ts_last,
+                        ts_init=ts_last,
+                    ),
+                ],
+            )
+
+        # Containers are in order by `ts_init` (that of their last delta) while their deltas overlap
+        data = [deltas(3, 5), deltas(4, 6)]
+
+        # Act
+        table = self.serializer.serialize_batch(data, data_cls=OrderBookDeltas)
+
+        # Assert
+        assert table.column("ts_init").to_pylist() == [3, 5, 4, 6]
+        assert table.column("flags").to_pylist() == [0, RecordFlag.F_LAST, 0, RecordFlag.F_LAST]
+
     def test_serialize_and_deserialize_order_book_delta(self):
         # Arrange
         delta = OrderBookDelta(
@@ -774,6 +810,31 @@ class TestArrowSerializer:
         # Assert
         assert deserialized == [event]
 
+    def test_serialize_batch_order_submitted_events_single_record_batch(self):
+        # Arrange
+        events = [
+            OrderSubmitted(
+                self.trader_id,
+                self.strategy_id,
+                AUDUSD_SIM.id,
+                ClientOrderId(f"O-{i}"),
+                self.account_id,
+                UUID4(),
+                i,
+                i,
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        serialized = self.serializer.serialize_batch(events, data_cls=OrderSubmitted)
+        deserialized = self.serializer.deserialize(OrderSubmitted, batch=serialized)
+
+        # Assert
+        assert serialized.num_rows == 3
+        assert len(serialized.to_batches()) == 1
+        assert deserialized == events
+
     def test_serialize_and_deserialize_order_accepted_events(self):
         # Arrange
         event = OrderAccepted(